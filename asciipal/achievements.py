@@ -6,6 +6,11 @@ from datetime import date
 from pathlib import Path
 from typing import Any
 
+try:  # C-implemented serializer; saves run on every milestone tick.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from asciipal.activity_tracker import ActivityTotals
 
 
@@ -195,10 +200,16 @@ class AchievementManager:
 
     def save(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
-            json.dumps(self._stats.to_dict(), indent=2),
-            encoding="utf-8",
-        )
+        if orjson is not None:
+            # orjson emits bytes directly, skipping the encode in write_text.
+            self._path.write_bytes(
+                orjson.dumps(self._stats.to_dict(), option=orjson.OPT_INDENT_2)
+            )
+        else:
+            self._path.write_text(
+                json.dumps(self._stats.to_dict(), indent=2),
+                encoding="utf-8",
+            )
 
     def format_stats_report(self) -> str:
         s = self._stats
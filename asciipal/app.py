@@ -3,8 +3,10 @@ from __future__ import annotations
 import argparse
 import platform
 import subprocess
-from dataclasses import asdict, dataclass
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import cached_property, lru_cache
 import signal
 import sys
 from time import sleep
@@ -35,7 +37,56 @@ def _make_wave(length: int) -> str:
     return (unit * ((length + 1) // 2))[:length]
 
 
-def _merge_plants(char_art: str, plant_lines: list[str], content_w: int) -> list[str]:
+# Water surface drift: slow 4-phase cycle for a calm, tranquil feel.
+_SURFACE_PHASES = (
+    " · . · . · . ·",
+    "· . · . · . · .",
+    ". · . · . · . ·",
+    " . · . · . · . ",
+)
+
+
+@lru_cache(maxsize=32)
+def _water_surface_row(inner_w: int, phase_idx: int) -> str:
+    phase = _SURFACE_PHASES[phase_idx]
+    return (phase * ((inner_w + len(phase) - 1) // len(phase)))[:inner_w]
+
+
+@lru_cache(maxsize=32)
+def _sand_row(inner_w: int) -> str:
+    return ("·." * ((inner_w + 1) // 2))[:inner_w]
+
+
+@lru_cache(maxsize=32)
+def _panel_top_border(title: str, inner_w: int) -> str:
+    label = f"── {title} "
+    fill_len = max(inner_w - 2 - len(label), 0)
+    return f"╭{label}{'─' * fill_len}╮"
+
+
+@lru_cache(maxsize=32)
+def _panel_bottom_border(inner_w: int) -> str:
+    return f"╰{'─' * (inner_w - 2)}╯"
+
+
+@lru_cache(maxsize=64)
+def _uniform_region(tag: str, width: int) -> tuple[str, ...]:
+    """One shared tuple per (tag, width) for rows with a single region tag.
+
+    The tag vocabulary is tiny and fixed, so interning plus the cache
+    collapses ``width`` string references per row to one shared tuple.
+    Only rows that are never mutated after creation may use this.
+    """
+    return (sys.intern(tag),) * width
+
+
+@lru_cache(maxsize=64)
+def _rep(ch: str, n: int) -> str:
+    """One shared string per (char, length) repeat, e.g. blank padding rows."""
+    return sys.intern(ch * n)
+
+
+def _merge_plants(char_art: str, plant_lines: Sequence[str], content_w: int) -> list[str]:
     """Overlay plant characters onto centered character art lines.
 
     Plants align to the bottom of the character art and only fill spaces
@@ -49,32 +100,70 @@ def _merge_plants(char_art: str, plant_lines: list[str], content_w: int) -> list
     result_height = max(len(centered), len(plant_lines))
     # Pad centered lines at the top if plants are taller than the character
     while len(centered) < result_height:
-        centered.insert(0, " " * content_w)
+        centered.insert(0, _rep(" ", content_w))
 
     plant_start = result_height - len(plant_lines)
     merged: list[str] = []
     for i, line in enumerate(centered):
         plant_idx = i - plant_start
         if 0 <= plant_idx < len(plant_lines):
-            buf = list(line.ljust(content_w))
+            padded = line.ljust(content_w)
             plant_line = plant_lines[plant_idx]
-            for j, ch in enumerate(plant_line):
-                if j < content_w and ch != " " and buf[j] == " ":
-                    buf[j] = ch
-            merged.append("".join(buf))
+            if padded.isascii() and plant_line.isascii():
+                # ASCII fast path: splice into a byte buffer in place
+                # instead of exploding the row into a list of 1-char strs.
+                buf = bytearray(padded, "ascii")
+                for j, ch in enumerate(plant_line):
+                    if j < content_w and ch != " " and buf[j] == 0x20:
+                        buf[j] = ord(ch)
+                merged.append(buf.decode("ascii"))
+            else:
+                chars = list(padded)
+                for j, ch in enumerate(plant_line):
+                    if j < content_w and ch != " " and chars[j] == " ":
+                        chars[j] = ch
+                merged.append("".join(chars))
         else:
             merged.append(line)
     return merged
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColoredDisplay:
     text: str
-    regions: list[list[str]]  # regions[row][col] = tag name
+    regions: tuple[tuple[str, ...], ...]  # regions[row][col] = tag name
+    # First row of each named section (sand, progress, panels, ...), so
+    # consumers patch rows by tag in O(1) instead of scanning the lines.
+    row_index: dict[str, int] = field(default_factory=dict)
+    # Primary tag per row (interned), for O(1) "is this a sand/panel row"
+    # checks instead of scanning the row's cells.
+    row_tag: tuple[str, ...] = ()
+
+    def diff(self, prev: "ColoredDisplay") -> list[tuple[int, str]]:
+        """Return ``(row, line)`` pairs that differ from *prev*.
+
+        Template-cached region rows are shared objects across frames, so
+        the identity check settles most rows without an element-wise
+        compare. Rows beyond the end of *prev* always count as changed.
+        """
+        lines = self.text.split("\n")
+        prev_lines = prev.text.split("\n")
+        regions = self.regions
+        prev_regions = prev.regions
+        n_prev = len(prev_lines)
+        changed: list[tuple[int, str]] = []
+        for i, line in enumerate(lines):
+            if i >= n_prev or line != prev_lines[i]:
+                changed.append((i, line))
+                continue
+            row, prev_row = regions[i], prev_regions[i]
+            if row is not prev_row and row != prev_row:
+                changed.append((i, line))
+        return changed
 
 
 def _merge_plants_colored(
-    char_art: str, plant_lines: list[str], content_w: int,
+    char_art: str, plant_lines: Sequence[str], content_w: int,
 ) -> tuple[list[str], list[list[str]]]:
     """Like ``_merge_plants`` but also returns a per-cell region grid.
 
@@ -92,7 +181,7 @@ def _merge_plants_colored(
 
     result_height = max(len(centered), len(plant_lines))
     while len(centered) < result_height:
-        centered.insert(0, " " * content_w)
+        centered.insert(0, _rep(" ", content_w))
 
     plant_start = result_height - len(plant_lines)
     merged: list[str] = []
@@ -100,14 +189,27 @@ def _merge_plants_colored(
     for i, line in enumerate(centered):
         plant_idx = i - plant_start
         if 0 <= plant_idx < len(plant_lines):
-            buf = list(line.ljust(content_w))
-            tag_row = ["dino" if ch != " " else "default" for ch in buf]
+            padded = line.ljust(content_w)
             plant_line = plant_lines[plant_idx]
+            if padded.isascii() and plant_line.isascii():
+                # Same byte-buffer splice as _merge_plants, extended with
+                # the parallel tag row.
+                buf = bytearray(padded, "ascii")
+                tag_row = ["dino" if b != 0x20 else "default" for b in buf]
+                for j, ch in enumerate(plant_line):
+                    if j < content_w and ch != " " and buf[j] == 0x20:
+                        buf[j] = ord(ch)
+                        tag_row[j] = "plant"
+                merged.append(buf.decode("ascii"))
+                regions.append(tag_row)
+                continue
+            chars = list(padded)
+            tag_row = ["dino" if ch != " " else "default" for ch in chars]
             for j, ch in enumerate(plant_line):
-                if j < content_w and ch != " " and buf[j] == " ":
-                    buf[j] = ch
+                if j < content_w and ch != " " and chars[j] == " ":
+                    chars[j] = ch
                     tag_row[j] = "plant"
-            merged.append("".join(buf))
+            merged.append("".join(chars))
             regions.append(tag_row)
         else:
             row_tags = ["dino" if ch != " " else "default" for ch in line]
@@ -135,6 +237,50 @@ def _compose_display(
 ) -> ColoredDisplay:
     """Build the aquarium display with water surface and sandy ground.
 
+    Thin wrapper that normalizes the list arguments to hashable tuples and
+    delegates to the memoized worker, so identical frames skip the full
+    O(rows x cols) rebuild. ``ColoredDisplay`` is immutable, so the cached
+    instance is returned as-is — no defensive copies.
+    """
+    return _compose_display_cached(
+        char_art,
+        tuple(above_lines),
+        tuple(plant_lines),
+        progress_line,
+        status_line,
+        achievement_line,
+        inner_w,
+        tuple(overlays) if overlays else None,
+        tuple(weather_panel_lines) if weather_panel_lines else None,
+        tuple(sysinfo_lines) if sysinfo_lines else None,
+        anim_frame,
+        tuple(pomodoro_panel_lines) if pomodoro_panel_lines else None,
+        goal_line,
+        streak_line,
+        tuple(biome_decorations) if biome_decorations else None,
+    )
+
+
+@lru_cache(maxsize=256)
+def _compose_display_cached(
+    char_art: str,
+    above_lines: tuple[str, ...],
+    plant_lines: tuple[str, ...],
+    progress_line: str,
+    status_line: str,
+    achievement_line: str,
+    inner_w: int,
+    overlays: tuple[tuple[int, int, str, str], ...] | None = None,
+    weather_panel_lines: tuple[str, ...] | None = None,
+    sysinfo_lines: tuple[str, ...] | None = None,
+    anim_frame: int = 0,
+    pomodoro_panel_lines: tuple[str, ...] | None = None,
+    goal_line: str = "",
+    streak_line: str = "",
+    biome_decorations: tuple[tuple[int, int, str], ...] | None = None,
+) -> ColoredDisplay:
+    """Build the aquarium display with water surface and sandy ground.
+
     Weather effects go above the character. Plants grow around the
     character. Effect overlays (bubbles, fireflies, creatures) fill
     empty spaces. Progress bar sits below the aquarium ground.
@@ -142,26 +288,21 @@ def _compose_display(
     Returns a ``ColoredDisplay`` with both the text and per-cell region tags.
     """
     # Sandy ground: soft dot pattern (borderless)
-    sand_unit = "·."
-    sand_fill = (sand_unit * ((inner_w + 1) // 2))[:inner_w]
+    sand_fill = _sand_row(inner_w)
     total_w = inner_w
     content_w = inner_w
 
     # Build content lines and region grid, all exactly content_w wide
     content_lines: list[str] = []
     content_regions: list[list[str]] = []
+    content_row_tags: list[str] = []
 
-    # Water surface row — slow 4-phase drift for a calm, tranquil feel
-    _surface_phases = (
-        " · . · . · . ·",
-        "· . · . · . · .",
-        ". · . · . · . ·",
-        " . · . · . · . ",
+    # Water surface row, cached per (width, drift phase)
+    content_lines.append(
+        _water_surface_row(content_w, anim_frame % len(_SURFACE_PHASES))
     )
-    phase = _surface_phases[anim_frame % len(_surface_phases)]
-    water_surface = (phase * ((content_w + len(phase) - 1) // len(phase)))[:content_w]
-    content_lines.append(water_surface)
     content_regions.append(["water"] * content_w)
+    content_row_tags.append("water")
 
     for line in above_lines:
         if line.strip():
@@ -170,6 +311,7 @@ def _compose_display(
             content_regions.append(
                 ["weather" if ch != " " else "default" for ch in centered]
             )
+            content_row_tags.append("weather")
 
     merged_lines, merged_regions = _merge_plants_colored(char_art, plant_lines, content_w)
     for line, region_row in zip(merged_lines, merged_regions):
@@ -182,6 +324,7 @@ def _compose_display(
             region_row = ["default"] * left_pad + region_row + ["default"] * right_pad
         content_lines.append(centered)
         content_regions.append(region_row[:content_w])
+        content_row_tags.append("dino")
 
     # Apply biome decorations (only fill empty spaces)
     if biome_decorations:
@@ -216,45 +359,60 @@ def _compose_display(
 
     # Build output parts and region rows (borderless)
     parts: list[str] = []
-    all_regions: list[list[str]] = []
+    all_regions: list[Sequence[str]] = []
+    row_tags: list[str] = []
+    row_index: dict[str, int] = {}
 
     for i, line in enumerate(content_lines):
         parts.append(line)
         all_regions.append(content_regions[i])
+        row_tags.append(content_row_tags[i])
 
+    row_index["sand"] = len(parts)
     parts.append(sand_fill)
-    all_regions.append(["sand"] * total_w)
+    all_regions.append(_uniform_region("sand", total_w))
+    row_tags.append("sand")
 
     if progress_line:
         centered = f"{progress_line:^{total_w}}"
+        row_index["progress"] = len(parts)
         parts.append(centered)
         all_regions.append(
             ["progress" if ch != " " else "default" for ch in centered]
         )
+        row_tags.append("progress")
     if status_line:
         centered = f"{status_line:^{total_w}}"
+        row_index["status"] = len(parts)
         parts.append(centered)
         all_regions.append(
             ["status" if ch != " " else "default" for ch in centered]
         )
+        row_tags.append("status")
     if achievement_line:
         centered = f"{achievement_line:^{total_w}}"
+        row_index["achievement"] = len(parts)
         parts.append(centered)
         all_regions.append(
             ["achievement" if ch != " " else "default" for ch in centered]
         )
+        row_tags.append("achievement")
     if goal_line:
         centered = f"{goal_line:^{total_w}}"
+        row_index["goal"] = len(parts)
         parts.append(centered)
         all_regions.append(
             ["goal" if ch != " " else "default" for ch in centered]
         )
+        row_tags.append("goal")
     if streak_line:
         centered = f"{streak_line:^{total_w}}"
+        row_index["streak"] = len(parts)
         parts.append(centered)
         all_regions.append(
             ["streak" if ch != " " else "default" for ch in centered]
         )
+        row_tags.append("streak")
 
     # Sub-panels below the aquarium
     sysinfo_content = sysinfo_lines if sysinfo_lines else []
@@ -267,18 +425,19 @@ def _compose_display(
             continue
         # Blank separator
         parts.append("")
-        all_regions.append(["default"] * total_w)
+        all_regions.append(_uniform_region("default", total_w))
+        row_tags.append("default")
         # Top border:  ╭── Title ──...──╮
-        label = f"── {panel_title} "
-        fill_len = max(total_w - 2 - len(label), 0)
-        top_border = f"╭{label}{'─' * fill_len}╮"
+        top_border = _panel_top_border(panel_title, total_w)
+        row_index[panel_tag] = len(parts)
         parts.append(top_border)
-        all_regions.append([panel_tag] * len(top_border))
+        all_regions.append(_uniform_region(panel_tag, len(top_border)))
+        row_tags.append(panel_tag)
         # Content rows
         for cl in panel_content_lines:
             padded = f"{cl:^{total_w - 4}}"
             row = f"│ {padded} │"
-            row_tags = (
+            cell_tags = (
                 [panel_tag]  # │
                 + ["default"]  # space
                 + [panel_tag if ch != " " else "default" for ch in padded]
@@ -286,13 +445,38 @@ def _compose_display(
                 + [panel_tag]  # │
             )
             parts.append(row)
-            all_regions.append(row_tags)
+            all_regions.append(cell_tags)
+            row_tags.append(panel_tag)
         # Bottom border
-        bot_border = f"╰{'─' * (total_w - 2)}╯"
+        bot_border = _panel_bottom_border(total_w)
         parts.append(bot_border)
-        all_regions.append([panel_tag] * len(bot_border))
+        all_regions.append(_uniform_region(panel_tag, len(bot_border)))
+        row_tags.append(panel_tag)
+
+    return ColoredDisplay(
+        text="\n".join(parts),
+        # tuple(row) is a no-op for rows already shared via _uniform_region.
+        regions=tuple(tuple(row) for row in all_regions),
+        row_index=row_index,
+        row_tag=tuple(sys.intern(tag) for tag in row_tags),
+    )
+
 
-    return ColoredDisplay(text="\n".join(parts), regions=all_regions)
+# Status lines per break stage, precomputed so _render_status only does
+# table lookups per tick; the verbose on-break/soon variants %-format the
+# minute count into an otherwise constant template.
+_STATUS_ON_BREAK = "Break: resting"
+_STATUS_ON_BREAK_VERBOSE = "Break: resting (%dm left)"
+_STATUS_BREAK_SOON = "Break soon: %dm"
+# stage -> (display state, plain line, verbose line) for a due break
+_STATUS_DUE: dict[str, tuple[str, str, str]] = {
+    stage: (
+        "alarmed" if stage in ("insistence", "tantrum") else "watching",
+        f"Break: {stage}",
+        f"Break: {stage} (due now)",
+    )
+    for stage in ("none", "suggestion", "insistence", "tantrum")
+}
 
 
 class AsciiPalApp:
@@ -322,16 +506,6 @@ class AsciiPalApp:
         self._anim_tick_counter = 0
         self._eating_ticks = 0
         self._eating_cooldown = 20
-        self.tracker = ActivityTracker()
-        self.state_machine = StateMachine(config)
-        self.break_manager = BreakManager(config)
-        self.character = CharacterRenderer(config)
-        self.time_awareness = TimeAwarenessManager(config)
-        self.achievements = AchievementManager()
-        self.effects = EffectsManager()
-        # Fixed inner width for the aquarium (must be even for wave pattern).
-        raw_inner = max(self.character.max_art_width + 16, 36)
-        self._display_inner_w = raw_inner + (raw_inner % 2)
         self.overlay = None
         if not headless:
             try:
@@ -349,12 +523,57 @@ class AsciiPalApp:
                 self.startup_notes.append(f"GUI overlay unavailable: {exc}. Falling back to headless mode.")
         self._goal_met = False
         self._last_session_seconds: float = 0.0
-        self.weather = WeatherManager(config)
-        self.system_resources = SystemResourcesManager()
-        self.battery: BatteryManager | None = None
-        if getattr(config, "battery_enabled", True):
-            self.battery = BatteryManager()
-        self.input_monitor = InputMonitor(
+
+    # Subsystems are built on first touch: a real run reaches all of them
+    # on the first tick, while short-lived instances (tests, --print-state)
+    # never pay for the ones they do not use. shutdown() checks
+    # ``"name" in self.__dict__`` so untouched subsystems stay untouched.
+
+    @cached_property
+    def tracker(self) -> ActivityTracker:
+        return ActivityTracker()
+
+    @cached_property
+    def state_machine(self) -> StateMachine:
+        return StateMachine(self.config)
+
+    @cached_property
+    def break_manager(self) -> BreakManager:
+        return BreakManager(self.config)
+
+    @cached_property
+    def character(self) -> CharacterRenderer:
+        return CharacterRenderer(self.config)
+
+    @cached_property
+    def time_awareness(self) -> TimeAwarenessManager:
+        return TimeAwarenessManager(self.config)
+
+    @cached_property
+    def achievements(self) -> AchievementManager:
+        return AchievementManager()
+
+    @cached_property
+    def effects(self) -> EffectsManager:
+        return EffectsManager()
+
+    @cached_property
+    def weather(self) -> WeatherManager:
+        return WeatherManager(self.config)
+
+    @cached_property
+    def system_resources(self) -> SystemResourcesManager:
+        return SystemResourcesManager()
+
+    @cached_property
+    def battery(self) -> BatteryManager | None:
+        if getattr(self.config, "battery_enabled", True):
+            return BatteryManager()
+        return None
+
+    @cached_property
+    def input_monitor(self) -> InputMonitor:
+        return InputMonitor(
             InputCallbacks(
                 on_keypress=self.tracker.record_keypress,
                 on_click=self.tracker.record_click,
@@ -362,6 +581,12 @@ class AsciiPalApp:
             )
         )
 
+    @cached_property
+    def _display_inner_w(self) -> int:
+        # Fixed inner width for the aquarium (must be even for wave pattern).
+        raw_inner = max(self.character.max_art_width + 16, 36)
+        return raw_inner + (raw_inner % 2)
+
     def _build_pomodoro_lines(self, status: BreakStatus) -> list[str] | None:
         if not self.config.pomodoro_mode:
             return None
@@ -556,21 +781,16 @@ class AsciiPalApp:
         if status.stage == "on_break":
             if mode == "verbose":
                 minutes = int((status.break_seconds_remaining + 59) // 60)
-                return "sleeping", f"Break: resting ({minutes}m left)"
-            return "sleeping", "Break: resting"
+                return "sleeping", _STATUS_ON_BREAK_VERBOSE % minutes
+            return "sleeping", _STATUS_ON_BREAK
 
         if status.should_break:
-            if status.stage in {"insistence", "tantrum"}:
-                state = "alarmed"
-            else:
-                state = "watching"
-            if mode == "verbose":
-                return state, f"Break: {status.stage} (due now)"
-            return state, f"Break: {status.stage}"
+            state, plain, verbose = _STATUS_DUE[status.stage]
+            return state, verbose if mode == "verbose" else plain
 
         if mode == "verbose" and status.stage == "suggestion":
             minutes = int((status.seconds_until_break + 59) // 60)
-            return current_state, f"Break soon: {minutes}m"
+            return current_state, _STATUS_BREAK_SOON % minutes
 
         return current_state, ""
 
@@ -608,10 +828,13 @@ class AsciiPalApp:
             return
         self._shutdown_done = True
         self._running = False
-        self.achievements.update_break_streak()
-        self.achievements.save()
-        self.weather.stop()
-        self.input_monitor.stop()
+        if "achievements" in self.__dict__:
+            self.achievements.update_break_streak()
+            self.achievements.save()
+        if "weather" in self.__dict__:
+            self.weather.stop()
+        if "input_monitor" in self.__dict__:
+            self.input_monitor.stop()
         try:
             if self.overlay is not None:
                 self.overlay.root.quit()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import random as _rng_mod
+from bisect import bisect_right
+from functools import lru_cache
 
 from asciipal.activity_tracker import ActivityTotals
 
@@ -33,13 +35,17 @@ PLANT_SPRITES: dict[str, tuple[list[str], list[str]]] = {
 PLANT_BIRTH_LEVELS = [1, 3, 5, 7, 8]
 
 
+_PLANT_THRESHOLDS_TUPLE = tuple(PLANT_THRESHOLDS)
+
+
 def _plant_level(totals: ActivityTotals) -> int:
     """Determine plant growth level (0-8) from active time."""
-    secs = totals.total_active_seconds
-    for i, threshold in enumerate(PLANT_THRESHOLDS):
-        if secs < threshold:
-            return i
-    return len(PLANT_THRESHOLDS)
+    return bisect_right(_PLANT_THRESHOLDS_TUPLE, totals.total_active_seconds)
+
+
+# Thresholds with a leading 0, so the bracket around any level is two
+# adjacent entries instead of a conditional on level 0.
+_PLANT_BOUNDS = (0, *_PLANT_THRESHOLDS_TUPLE)
 
 
 def _plant_progress(totals: ActivityTotals) -> tuple[int, float]:
@@ -48,23 +54,34 @@ def _plant_progress(totals: ActivityTotals) -> tuple[int, float]:
     At max level (8), fraction is 1.0.
     """
     secs = totals.total_active_seconds
-    level = _plant_level(totals)
-    if level >= len(PLANT_THRESHOLDS):
+    level = bisect_right(_PLANT_THRESHOLDS_TUPLE, secs)
+    if level >= len(_PLANT_THRESHOLDS_TUPLE):
         return level, 1.0
-    threshold = PLANT_THRESHOLDS[level]
-    prev = PLANT_THRESHOLDS[level - 1] if level > 0 else 0
-    return level, (secs - prev) / (threshold - prev)
+    lo = _PLANT_BOUNDS[level]
+    return level, (secs - lo) / (_PLANT_BOUNDS[level + 1] - lo)
+
+
+@lru_cache(maxsize=512)
+def _progress_bar_quantized(filled: int, bar_inner: int, width: int) -> str:
+    return ("[" + "▰" * filled + "▱" * (bar_inner - filled) + "]")[:width]
 
 
 def _build_progress_bar(level: int, progress: float, width: int) -> str:
-    """Render a full-width progress bar fitted to exactly *width* chars."""
+    """Render a full-width progress bar fitted to exactly *width* chars.
+
+    The fill count quantizes ``progress`` to at most ``width - 2`` distinct
+    bars per width, so repeated ticks hit the cache above.
+    """
     bar_inner = width - 2  # account for [ and ]
     if bar_inner < 1:
         bar_inner = 1
     filled = int(bar_inner * progress)
     filled = max(0, min(filled, bar_inner))
-    bar = "[" + "▰" * filled + "▱" * (bar_inner - filled) + "]"
-    return bar[:width]
+    return _progress_bar_quantized(filled, bar_inner, width)
+
+
+# Indexed by level; see the table in _plant_dimensions below.
+_PLANT_DIMS = ((0, 0), (1, 1), (1, 2), (2, 2), (2, 3), (3, 3), (3, 4), (4, 4), (5, 5))
 
 
 def _plant_dimensions(level: int) -> tuple[int, int]:
@@ -82,17 +99,7 @@ def _plant_dimensions(level: int) -> tuple[int, int]:
     """
     if level <= 0:
         return (0, 0)
-    mapping = {
-        1: (1, 1),
-        2: (1, 2),
-        3: (2, 2),
-        4: (2, 3),
-        5: (3, 3),
-        6: (3, 4),
-        7: (4, 4),
-        8: (5, 5),
-    }
-    return mapping.get(level, (5, 5))
+    return _PLANT_DIMS[level] if level < len(_PLANT_DIMS) else (5, 5)
 
 
 def _plant_species_name(col_index: int, current_level: int) -> str:
@@ -108,28 +115,58 @@ def _plant_species_name(col_index: int, current_level: int) -> str:
     return "flower"
 
 
-def _build_plants(level: int, width: int, frame: int) -> list[str]:
-    """Build multi-line flower sprites with staggered growth."""
-    if level <= 0 or width < 4:
-        return []
-    num_cols, height = _plant_dimensions(level)
-    positions = [2, width // 4, width // 2, 3 * width // 4, width - 3]
+@lru_cache(maxsize=32)
+def _plant_slots(level: int, width: int) -> tuple[tuple[int, str], ...]:
+    """Return the ``(column, species)`` layout for a level — pure in its args."""
+    num_cols, _height = _plant_dimensions(level)
+    positions = (2, width // 4, width // 2, 3 * width // 4, width - 3)
     num_cols = min(num_cols, len(positions))
-    grid = [list(" " * width) for _ in range(height)]
-    for i in range(num_cols):
-        pos = positions[i]
-        species = _plant_species_name(i, level)
-        full_sprite = PLANT_SPRITES[species][frame % 2]
+    return tuple(
+        (positions[i], _plant_species_name(i, level)) for i in range(num_cols)
+    )
+
+
+@lru_cache(maxsize=64)
+def _plant_rows(level: int, width: int, parity: int) -> tuple[str, ...]:
+    """Assemble plant rows for one animation parity.
+
+    Sprites are pure ASCII, so rows build in byte buffers with in-place
+    stores instead of per-cell list surgery. With only two parities per
+    ``(level, width)`` the cache makes repeat frames free.
+    """
+    _num_cols, height = _plant_dimensions(level)
+    grid = [bytearray(b" " * width) for _ in range(height)]
+    for pos, species in _plant_slots(level, width):
+        full_sprite = PLANT_SPRITES[species][parity]
         # Show top N rows (flower head first, stem revealed as height grows)
         visible = full_sprite[:min(height, len(full_sprite))]
         start_row = height - len(visible)
         for r, sprite_row in enumerate(visible):
-            grid_row = start_row + r
+            row_buf = grid[start_row + r]
             for j, ch in enumerate(sprite_row):
                 col = pos - 1 + j
                 if 0 <= col < width and ch != " ":
-                    grid[grid_row][col] = ch
-    return ["".join(row) for row in grid]
+                    row_buf[col] = ord(ch)
+    return tuple(row.decode("ascii") for row in grid)
+
+
+def _build_plants(level: int, width: int, frame: int) -> list[str]:
+    """Build multi-line flower sprites with staggered growth."""
+    if level <= 0 or width < 4:
+        return []
+    return list(_plant_rows(level, width, frame % 2))
+
+
+@lru_cache(maxsize=1024)
+def _scene_cached(
+    level: int, filled: int, content_w: int, parity: int,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    bar_inner = max(content_w - 2, 1)
+    bar = _progress_bar_quantized(filled, bar_inner, content_w)
+    plants: tuple[str, ...] = ()
+    if level > 0 and content_w >= 4:
+        plants = _plant_rows(level, content_w, parity)
+    return (bar,), plants
 
 
 def build_aquarium_scene(
@@ -139,19 +176,16 @@ def build_aquarium_scene(
 
     Progress bar shows how close the user is to the next plant.
     Plants grow at ground level.
-    """
-    progress_lines: list[str] = []
-    plant_lines: list[str] = []
 
-    level = _plant_level(totals)
-    lvl, frac = _plant_progress(totals)
-    bar = _build_progress_bar(lvl, frac, content_w)
-    progress_lines.append(bar)
-
-    if level > 0:
-        plant_lines = _build_plants(level, content_w, frame)
-
-    return progress_lines, plant_lines
+    The scene only changes when the plant level, the quantized bar fill,
+    or the animation parity does, so those form the key for the cached
+    builder above.
+    """
+    level, frac = _plant_progress(totals)
+    bar_inner = max(content_w - 2, 1)
+    filled = max(0, min(int(bar_inner * frac), bar_inner))
+    progress, plants = _scene_cached(level, filled, content_w, frame % 2)
+    return list(progress), list(plants)
 
 
 BIOME_DECORATIONS: dict[int, list[str]] = {
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from dataclasses import replace as _dc_replace
 from pathlib import Path
 import os
-from typing import Any
+from typing import Any, ClassVar
 
 import yaml
 
@@ -90,6 +91,24 @@ class Config:
     cpu_load_enabled: bool = True
     sweating_load_threshold: float = 0.8
 
+    # Validated default instance built on first use; `replace` copies it
+    # instead of re-running full from_dict validation per call.
+    _default: ClassVar["Config | None"] = None
+
+    @classmethod
+    def replace(cls, **overrides: Any) -> "Config":
+        """Return a default-valued Config with *overrides* applied.
+
+        The defaults are already valid, so this skips the dict copy and
+        per-field validation of ``from_dict``. Overrides are not
+        re-validated — pass values a config file would be allowed to hold.
+        """
+        if cls._default is None:
+            cls._default = cls.from_dict(DEFAULT_CONFIG)
+        if "custom_art" not in overrides:
+            overrides["custom_art"] = dict(cls._default.custom_art)
+        return _dc_replace(cls._default, **overrides)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
         validate_config(data)
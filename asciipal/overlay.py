@@ -1,18 +1,28 @@
 from __future__ import annotations
 
 import platform
+import sys
 import tkinter as tk
+from functools import lru_cache
 from dataclasses import dataclass
+from itertools import groupby
 from tkinter import font
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Literal
 
 from asciipal.config import Config
 
 if TYPE_CHECKING:
     from asciipal.app import ColoredDisplay
 
+# The platform never changes mid-run; resolve it once at import time.
+_SYSTEM = platform.system()
 
-@dataclass
+# Installed font families don't change at runtime; querying them costs a
+# Tcl round trip returning hundreds of names, so do it once per process.
+_FAMILIES_CACHE: set[str] | None = None
+
+
+@dataclass(slots=True, frozen=True)
 class MenuCallbacks:
     on_take_break: Callable[[], None]
     on_skip_break: Callable[[], None]
@@ -203,32 +213,64 @@ _WIDGET_REGION_COLORS_RAW: dict[str, dict[str, str | None]] = {
     },
 }
 
-ALL_REGION_TAGS = (
+# Tag strings are produced from module-level literals, so CPython interns
+# them; interning our sentinel too makes the per-cell check a pointer compare.
+_DEFAULT = sys.intern("default")
+
+ALL_REGION_TAGS = tuple(sys.intern(tag) for tag in (
     "dino", "plant", "border", "bubble", "firefly",
     "fish", "butterfly", "snail", "cat", "crab", "seahorse",
     "weather", "progress",
     "status", "achievement", "weather_panel", "sysinfo",
     "pomodoro", "goal", "streak", "biome",
     "water", "sand", "default",
-)
+))
 
+# Byte-indexed view of the tag vocabulary: one byte per cell packs a tag row
+# into a bytes object whose equality check is a single memcmp.
+_TAG_INDEX = {tag: i for i, tag in enumerate(ALL_REGION_TAGS)}
+_DEFAULT_IDX = _TAG_INDEX[_DEFAULT]
 
+
+@lru_cache(maxsize=None)
 def _resolve_region_colors(
     scheme: str, fg: str, widget_mode: bool,
-) -> dict[str, str]:
-    """Return ``{tag: hex_color}`` for the given scheme."""
+) -> tuple[str, ...]:
+    """Return hex colors in ``ALL_REGION_TAGS`` order for the given scheme.
+
+    The tuple is indexed by tag byte (see ``_TAG_INDEX``), so hot loops can
+    use tuple indexing instead of dict lookups. Cached: the handful of
+    ``(scheme, fg, widget_mode)`` combinations are resolved once instead of
+    per overlay construction or scheme change.
+    """
     if widget_mode:
         raw = _WIDGET_REGION_COLORS_RAW.get(scheme, _WIDGET_REGION_COLORS_RAW.get("default", {}))
     else:
         raw = _REGION_COLORS_RAW.get(scheme, _REGION_COLORS_RAW.get("default", {}))
-    result: dict[str, str] = {}
-    for tag in ALL_REGION_TAGS:
-        color = raw.get(tag)
-        result[tag] = color if color is not None else fg
-    return result
+    return tuple(
+        raw.get(tag) or fg for tag in ALL_REGION_TAGS
+    )
 
 
 class Overlay:
+    # Tcl font objects are process-wide; share them across overlays instead
+    # of allocating a new one per instance. Reconfiguring a cached font
+    # (e.g. scroll-to-resize) propagates to every widget using it, and
+    # mutates the font in place — the size in the cache key is the initial
+    # size, not necessarily the current one.
+    _font_cache: dict[tuple[str, int, str], font.Font] = {}
+
+    @classmethod
+    def _get_font(
+        cls, family: str, size: int, weight: Literal["normal", "bold"]
+    ) -> font.Font:
+        key = (family, size, weight)
+        cached = cls._font_cache.get(key)
+        if cached is None:
+            cached = font.Font(family=family, size=size, weight=weight)
+            cls._font_cache[key] = cached
+        return cached
+
     def __init__(self, config: Config, menu_callbacks: MenuCallbacks | None = None) -> None:
         self.config = config
         self._menu_callbacks = menu_callbacks
@@ -267,26 +309,40 @@ class Overlay:
         base_size = max(int(64 * config.character_scale), 10)
         self._font_size = base_size
         family = self._pick_font_family()
-        self.text_font = font.Font(family=family, size=base_size)
+        self.text_font = self._get_font(family, base_size, "normal")
         self.text_widget.configure(font=self.text_font)
 
         # Configure color tags
-        self._bold_font = font.Font(family=family, size=base_size, weight="bold")
-        region_colors = _resolve_region_colors(config.color_scheme, fg, config.widget_mode)
-        for tag, color in region_colors.items():
-            if tag == "dino":
-                self.text_widget.tag_configure(tag, foreground=color, font=self._bold_font)
-            else:
-                self.text_widget.tag_configure(tag, foreground=color)
+        self._bold_font = self._get_font(family, base_size, "bold")
+        self._scheme_fg = fg
+        self._applied_region_colors: list[str | None] = [None] * len(ALL_REGION_TAGS)
+        self._apply_scheme()
 
         self._configure_transparency()
         self.text_widget.pack(fill="both", expand=True)
 
         # Width stabilisation — ratchets up to the widest content seen.
         self._min_text_width = 0
-        self._last_plain_text: str | None = None
-        self._last_colored_text: str | None = None
-        self._last_colored_regions: list[list[str]] | None = None
+        self._applied_width = 0
+        # Width scans are skipped while the total text length is stable.
+        self._last_text_len = -1
+        self._cached_max_w = 0
+        self._last_plain_hash: int | None = None
+        self._last_colored_fp: int | None = None
+        self._last_colored_lines: list[str] | None = None
+        self._last_colored_regions: tuple[bytes, ...] | None = None
+        # Precomputed "row.col" index strings, keyed by display shape.
+        self._idx_cache: dict[int, list[tuple[str, str]]] = {}
+
+        # While the window is unmapped (hidden/minimized) updates are
+        # stashed here and flushed when it becomes viewable again.
+        self._pending_plain: str | None = None
+        self._pending_colored: ColoredDisplay | None = None
+        self.root.bind("<Map>", self._on_map)
+
+        # Window placement is coalesced into a single idle callback so a
+        # burst of updates pays for one geometry pass.
+        self._place_pending = False
 
         # Drag support — bind to both root and text_widget for reliability
         self._user_dragged = False
@@ -322,6 +378,27 @@ class Overlay:
         self.root.deiconify()  # Show now that everything is configured
         self.root.after(10, self._place_window)
 
+    def _apply_scheme(self) -> None:
+        """(Re)configure region-color tags for the current color scheme.
+
+        Mutates existing tag configs in place so a scheme change does not
+        require tearing down the widget; tags whose color is unchanged
+        since the last application are skipped.
+        """
+        region_colors = _resolve_region_colors(
+            self.config.color_scheme, self._scheme_fg, self.config.widget_mode,
+        )
+        applied = self._applied_region_colors
+        for idx, color in enumerate(region_colors):
+            if applied[idx] == color:
+                continue
+            applied[idx] = color
+            tag = ALL_REGION_TAGS[idx]
+            if tag == "dino":
+                self.text_widget.tag_configure(tag, foreground=color, font=self._bold_font)
+            else:
+                self.text_widget.tag_configure(tag, foreground=color)
+
     def _on_drag_start(self, event: tk.Event) -> None:
         self._drag_start_x = event.x
         self._drag_start_y = event.y
@@ -329,7 +406,8 @@ class Overlay:
     def _on_drag_motion(self, event: tk.Event) -> None:
         dx = event.x - self._drag_start_x
         dy = event.y - self._drag_start_y
-        if not self._user_dragged and abs(dx) < 3 and abs(dy) < 3:
+        # Squared distance avoids two abs() calls per high-frequency event.
+        if not self._user_dragged and dx * dx + dy * dy < 9:
             return
         self._user_dragged = True
         x = self.root.winfo_x() + dx
@@ -341,11 +419,8 @@ class Overlay:
         self._place_window()
 
     def _on_mousewheel(self, event: tk.Event) -> None:
-        if platform.system() == "Darwin":
-            delta = 1 if event.delta > 0 else -1
-        else:
-            delta = 1 if event.delta > 0 else -1
-        self._on_scroll(delta)
+        # Wheel delta sign is all we need; magnitude differs per platform.
+        self._on_scroll(1 if event.delta > 0 else -1)
 
     def _on_scroll(self, delta: int) -> None:
         step = 2 if delta > 0 else -2
@@ -355,74 +430,170 @@ class Overlay:
 
     def set_min_width(self, width: int) -> None:
         self._min_text_width = max(self._min_text_width, width)
-        self.text_widget.configure(width=self._min_text_width)
+        self._apply_min_width()
+
+    def _apply_min_width(self) -> None:
+        # configure(width=...) triggers a Tk re-layout; skip when unchanged.
+        if self._min_text_width != self._applied_width:
+            self._applied_width = self._min_text_width
+            self.text_widget.configure(width=self._min_text_width)
+
+    def _on_map(self, _event: tk.Event) -> None:
+        if self._pending_plain is not None:
+            text, self._pending_plain = self._pending_plain, None
+            self.update_text(text)
+        elif self._pending_colored is not None:
+            display, self._pending_colored = self._pending_colored, None
+            self.update_colored(display)
 
     def update_text(self, text: str) -> None:
         """Backward-compatible plain-text update (no color tags)."""
-        if text == self._last_plain_text:
+        if not self.root.winfo_viewable():
+            self._pending_plain = text
+            self._pending_colored = None
+            return
+        # Integer hash compare gates the common "nothing changed" tick
+        # without re-scanning multi-KB frames byte by byte.
+        h = hash(text)
+        if h == self._last_plain_hash:
             return
-        self._last_plain_text = text
-        self._last_colored_text = None
+        self._last_plain_hash = h
+        self._last_colored_fp = None
+        self._last_colored_lines = None
         self._last_colored_regions = None
 
-        lines = text.split("\n")
-        max_w = max((len(ln) for ln in lines), default=0)
-        if max_w > self._min_text_width:
-            self._min_text_width = max_w
-            self.text_widget.configure(width=self._min_text_width)
+        if len(text) != self._last_text_len:
+            self._last_text_len = len(text)
+            self._cached_max_w = max(map(len, text.split("\n")), default=0)
+            if self._cached_max_w > self._min_text_width:
+                self._min_text_width = self._cached_max_w
+                self._apply_min_width()
         self.text_widget.configure(state="normal")
         self.text_widget.delete("1.0", "end")
         self.text_widget.insert("1.0", text)
         self.text_widget.configure(state="disabled")
-        self.root.update_idletasks()
-        if not self._user_dragged:
-            self._place_window()
+        self._schedule_place()
+
+    def _schedule_place(self) -> None:
+        if not self._user_dragged and not self._place_pending:
+            self._place_pending = True
+            self.root.after_idle(self._do_place)
+
+    def _do_place(self) -> None:
+        self._place_pending = False
+        self._place_window()
 
     def update_colored(self, display: ColoredDisplay) -> None:
         """Update the widget with colored text using region tags."""
+        if not self.root.winfo_viewable():
+            self._pending_colored = display
+            self._pending_plain = None
+            return
         text = display.text
         regions = display.regions
-        if text == self._last_colored_text and self._last_colored_regions == regions:
+        # A single integer compare gates the common "nothing changed" tick;
+        # the byte-packed snapshot doubles as the stored copy for row diffing.
+        tag_idx = _TAG_INDEX.get
+        regions_snapshot = tuple(
+            bytes(tag_idx(t, _DEFAULT_IDX) for t in row) for row in regions
+        )
+        fp = hash((text, regions_snapshot))
+        if fp == self._last_colored_fp:
             return
-        self._last_colored_text = text
-        # Store a snapshot to avoid issues if caller mutates after passing.
-        self._last_colored_regions = [row[:] for row in regions]
-        self._last_plain_text = None
 
         lines = text.split("\n")
-        max_w = max((len(ln) for ln in lines), default=0)
-        if max_w > self._min_text_width:
-            self._min_text_width = max_w
-            self.text_widget.configure(width=self._min_text_width)
-
-        self.text_widget.configure(state="normal")
-        self.text_widget.delete("1.0", "end")
-        self.text_widget.insert("1.0", text)
-
-        # Apply color tags row by row
-        for row_idx, row_tags in enumerate(regions):
-            if row_idx >= len(lines):
-                break
-            line = lines[row_idx]
-            tk_row = row_idx + 1  # tk.Text lines are 1-indexed
-            col = 0
-            while col < len(row_tags) and col < len(line):
-                tag = row_tags[col]
-                if tag == "default":
-                    col += 1
+        if len(text) != self._last_text_len:
+            self._last_text_len = len(text)
+            self._cached_max_w = max(map(len, lines), default=0)
+            if self._cached_max_w > self._min_text_width:
+                self._min_text_width = self._cached_max_w
+                self._apply_min_width()
+
+        old_lines = self._last_colored_lines
+        old_regions = self._last_colored_regions
+
+        # Row index strings are stable per display shape; formatting them once
+        # avoids short-lived f-string allocations on every frame.
+        idx_cache = self._idx_cache.get(len(lines))
+        if idx_cache is None:
+            idx_cache = [(f"{r + 1}.0", f"{r + 1}.end") for r in range(len(lines))]
+            self._idx_cache[len(lines)] = idx_cache
+
+        # Bind the widget methods once; attribute lookup plus bound-method
+        # construction adds up over a whole frame of row rewrites.
+        tw = self.text_widget
+        insert = tw.insert
+        delete = tw.delete
+        row_args = self._row_insert_args
+
+        tw.configure(state="normal")
+        if old_lines is None or old_regions is None or len(old_lines) != len(lines):
+            # First frame, or the display changed shape — full rebuild.
+            delete("1.0", "end")
+            last = len(lines) - 1
+            for row_idx, line in enumerate(lines):
+                row_tags = (
+                    regions_snapshot[row_idx]
+                    if row_idx < len(regions_snapshot)
+                    else None
+                )
+                args = row_args(line, row_tags)
+                if row_idx != last:
+                    args.append("\n")
+                insert("end", *args)
+        else:
+            # Rewrite only rows whose text or tag row actually changed;
+            # mutating the Text widget dominates the cost of this method.
+            for row_idx, line in enumerate(lines):
+                # Displays may carry fewer region rows than text lines, so
+                # guard both snapshots like the full-rebuild branch does.
+                row_tags = (
+                    regions_snapshot[row_idx]
+                    if row_idx < len(regions_snapshot)
+                    else None
+                )
+                old_tags = (
+                    old_regions[row_idx] if row_idx < len(old_regions) else None
+                )
+                if line == old_lines[row_idx] and row_tags == old_tags:
                     continue
-                # Find the end of this contiguous span of the same tag
-                span_start = col
-                while col < len(row_tags) and col < len(line) and row_tags[col] == tag:
-                    col += 1
-                start_idx = f"{tk_row}.{span_start}"
-                end_idx = f"{tk_row}.{col}"
-                self.text_widget.tag_add(tag, start_idx, end_idx)
-
-        self.text_widget.configure(state="disabled")
-        self.root.update_idletasks()
-        if not self._user_dragged:
-            self._place_window()
+                row_start, row_end = idx_cache[row_idx]
+                delete(row_start, row_end)
+                insert(row_start, *row_args(line, row_tags))
+
+        tw.configure(state="disabled")
+
+        self._last_colored_fp = fp
+        self._last_colored_lines = lines
+        self._last_colored_regions = regions_snapshot
+        self._last_plain_hash = None
+        self._schedule_place()
+
+    @staticmethod
+    def _row_insert_args(line: str, row_tags: bytes | None) -> list:
+        """Build (chars, tags, chars, tags, ...) args for a single insert call.
+
+        ``row_tags`` is a byte-packed tag row (one _TAG_INDEX byte per cell).
+        Carrying the tags in the insert itself puts each row through one Tcl
+        round trip instead of an insert followed by per-span tag_add calls.
+        """
+        if row_tags is None or row_tags.count(_DEFAULT_IDX) == len(row_tags):
+            return [line, ()]
+        args: list = []
+        limit = min(len(line), len(row_tags))
+        col = 0
+        # groupby finds the runs in C instead of a per-column Python loop.
+        for idx, group in groupby(row_tags):
+            if col >= limit:
+                break
+            end = min(col + sum(1 for _ in group), limit)
+            args.append(line[col:end])
+            args.append(() if idx == _DEFAULT_IDX else (ALL_REGION_TAGS[idx],))
+            col = end
+        if limit < len(line):
+            args.append(line[limit:])
+            args.append(())
+        return args
 
     def run(self, tick_fn, tick_ms: int = 250) -> None:
         def _tick() -> None:
@@ -466,10 +637,9 @@ class Overlay:
         if not self.config.widget_mode:
             return
 
-        system = platform.system()
         # On macOS, rely solely on -alpha. Using -transparent True causes
         # the window to become click-through, which breaks drag.
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             try:
                 transparent_key = self._transparent_bg_color()
                 self.root.configure(bg=transparent_key)
@@ -483,8 +653,11 @@ class Overlay:
             "Windows": ["Consolas", "Courier New", "Lucida Console"],
             "Linux": ["DejaVu Sans Mono", "Liberation Mono", "Monospace"],
         }
-        by_platform = candidates.get(platform.system(), ["Monospace", "Courier"])
-        available = set(font.families(self.root))
+        by_platform = candidates.get(_SYSTEM, ["Monospace", "Courier"])
+        global _FAMILIES_CACHE
+        if _FAMILIES_CACHE is None:
+            _FAMILIES_CACHE = set(font.families(self.root))
+        available = _FAMILIES_CACHE
         for family in by_platform:
             if family in available:
                 return family
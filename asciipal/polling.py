@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sched
+import time
+from threading import Event, Lock, Thread
+from typing import Callable
+
+
+class SharedPollWorker:
+    """One daemon thread servicing all periodic background polls.
+
+    Managers that poll rarely (weather every 5+ minutes) used to each own a
+    thread that mostly slept; registering their callbacks here shares a
+    single thread stack and scheduler entry across all of them. Timing is
+    delegated to ``sched.scheduler``, with an Event-based delay function so
+    registrations and cancellations wake the worker immediately.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._wakeup = Event()
+        self._scheduler = sched.scheduler(time.monotonic, self._sleep)
+        self._events: dict[int, sched.Event] = {}
+        self._next_id = 0
+        self._thread: Thread | None = None
+
+    @property
+    def thread(self) -> Thread | None:
+        return self._thread
+
+    def register(self, callback: Callable[[], None], interval: float) -> int:
+        """Schedule ``callback`` to run now and then every ``interval`` seconds."""
+        with self._lock:
+            job_id = self._next_id
+            self._next_id += 1
+            self._events[job_id] = self._scheduler.enter(
+                0, 1, self._run_job, (job_id, interval, callback)
+            )
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return job_id
+
+    def unregister(self, job_id: int) -> None:
+        with self._lock:
+            event = self._events.pop(job_id, None)
+        if event is not None:
+            try:
+                self._scheduler.cancel(event)
+            except ValueError:
+                pass  # already running or ran
+        self._wakeup.set()
+
+    def _sleep(self, seconds: float) -> None:
+        self._wakeup.wait(seconds)
+        self._wakeup.clear()
+
+    def _run_job(self, job_id: int, interval: float, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if job_id not in self._events:
+                return  # unregistered while this run was pending
+            self._events[job_id] = self._scheduler.enter(
+                interval, 1, self._run_job, (job_id, interval, callback)
+            )
+        try:
+            callback()
+        except Exception:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            self._scheduler.run(blocking=True)
+            # Queue drained — park until the next registration.
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+
+POLL_WORKER = SharedPollWorker()
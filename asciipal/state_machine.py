@@ -16,12 +16,34 @@ class TransitionResult:
 
 
 class StateMachine:
+    __slots__ = (
+        "config",
+        "cooldown_seconds",
+        "state",
+        "_last_transition",
+        "_sweating",
+        "_sleep_t",
+        "_idle_t",
+        "_rage_t",
+        "_dizzy_t",
+        "_fast_wpm",
+        "_cheer_s",
+    )
+
     def __init__(self, config: Config, cooldown_seconds: float | None = None) -> None:
         self.config = config
         self.cooldown_seconds = config.state_cooldown_seconds if cooldown_seconds is None else cooldown_seconds
         self.state: State = "idle"
         self._last_transition = monotonic() - self.cooldown_seconds
         self._sweating: bool = False
+        # _derive_target_state runs every tick; hoist the config thresholds
+        # once so the hot path reads slots instead of chasing config attrs.
+        self._sleep_t = config.sleep_timeout_seconds
+        self._idle_t = config.idle_timeout_seconds
+        self._rage_t = config.rage_click_threshold
+        self._dizzy_t = config.dizzy_mouse_speed
+        self._fast_wpm = config.typing_fast_wpm
+        self._cheer_s = config.cheering_after_minutes * 60
 
     def set_sweating(self, val: bool) -> None:
         self._sweating = val
@@ -45,20 +67,21 @@ class StateMachine:
         self._last_transition = monotonic() if now is None else now
 
     def _derive_target_state(self, snapshot: ActivitySnapshot) -> State:
-        if snapshot.seconds_since_input >= self.config.sleep_timeout_seconds:
+        s = snapshot
+        if s.seconds_since_input >= self._sleep_t:
             return "sleeping"
-        if snapshot.seconds_since_input >= self.config.idle_timeout_seconds:
+        if s.seconds_since_input >= self._idle_t:
             return "idle"
-        if snapshot.click_rate >= self.config.rage_click_threshold:
+        if s.click_rate >= self._rage_t:
             return "alarmed"
-        if snapshot.mouse_speed >= self.config.dizzy_mouse_speed:
+        if s.mouse_speed >= self._dizzy_t:
             return "dizzy"
         if self._sweating:
             return "sweating"
-        if snapshot.typing_wpm >= self.config.typing_fast_wpm:
+        if s.typing_wpm >= self._fast_wpm:
             return "excited"
-        if snapshot.total_active_seconds >= self.config.cheering_after_minutes * 60:
+        if s.total_active_seconds >= self._cheer_s:
             return "cheering"
-        if snapshot.typing_wpm > 1 or snapshot.mouse_speed > 10:
+        if s.typing_wpm > 1 or s.mouse_speed > 10:
             return "watching"
         return "idle"
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
+import os
 import platform
 import shutil
-import subprocess
 import time
 from dataclasses import dataclass
-from threading import Lock
 
 
 @dataclass(slots=True)
@@ -38,52 +37,108 @@ def _get_memory_usage() -> tuple[float, float]:
 
 
 def _get_memory_macos() -> tuple[float, float]:
-    total_bytes = int(subprocess.check_output(
-        ["sysctl", "-n", "hw.memsize"],
-    ).strip())
+    # Direct sysctl/Mach calls via ctypes: no fork+exec of `sysctl` and
+    # `vm_stat` per poll, and no text output to parse.
+    import ctypes
+
+    libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+
+    def _sysctl_u64(name: bytes) -> int:
+        value = ctypes.c_uint64(0)
+        size = ctypes.c_size_t(ctypes.sizeof(value))
+        if libc.sysctlbyname(name, ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+            raise OSError(f"sysctlbyname({name.decode()}) failed")
+        return value.value
+
+    total_bytes = _sysctl_u64(b"hw.memsize")
     total_gb = total_bytes / (1024 ** 3)
+    try:
+        page_size = _sysctl_u64(b"hw.pagesize")
+    except OSError:
+        page_size = 4096
 
-    vm_output = subprocess.check_output(["vm_stat"]).decode()
-    page_size = 4096
-    free_pages = 0
-    inactive_pages = 0
-    speculative_pages = 0
-    for line in vm_output.splitlines():
-        if "page size of" in line:
-            page_size = int(line.split()[-2])
-        elif line.startswith("Pages free:"):
-            free_pages = int(line.split()[-1].rstrip("."))
-        elif line.startswith("Pages inactive:"):
-            inactive_pages = int(line.split()[-1].rstrip("."))
-        elif line.startswith("Pages speculative:"):
-            speculative_pages = int(line.split()[-1].rstrip("."))
-
-    free_bytes = (free_pages + inactive_pages + speculative_pages) * page_size
+    # struct vm_statistics64 from <mach/vm_statistics.h>
+    class VMStatistics64(ctypes.Structure):
+        _fields_ = [
+            ("free_count", ctypes.c_uint32),
+            ("active_count", ctypes.c_uint32),
+            ("inactive_count", ctypes.c_uint32),
+            ("wire_count", ctypes.c_uint32),
+            ("zero_fill_count", ctypes.c_uint64),
+            ("reactivations", ctypes.c_uint64),
+            ("pageins", ctypes.c_uint64),
+            ("pageouts", ctypes.c_uint64),
+            ("faults", ctypes.c_uint64),
+            ("cow_faults", ctypes.c_uint64),
+            ("lookups", ctypes.c_uint64),
+            ("hits", ctypes.c_uint64),
+            ("purges", ctypes.c_uint64),
+            ("purgeable_count", ctypes.c_uint32),
+            ("speculative_count", ctypes.c_uint32),
+            ("decompressions", ctypes.c_uint64),
+            ("compressions", ctypes.c_uint64),
+            ("swapins", ctypes.c_uint64),
+            ("swapouts", ctypes.c_uint64),
+            ("compressor_page_count", ctypes.c_uint32),
+            ("throttled_count", ctypes.c_uint32),
+            ("external_page_count", ctypes.c_uint32),
+            ("internal_page_count", ctypes.c_uint32),
+            ("total_uncompressed_pages_in_compressor", ctypes.c_uint64),
+        ]
+
+    HOST_VM_INFO64 = 4
+    stats = VMStatistics64()
+    count = ctypes.c_uint(ctypes.sizeof(stats) // 4)
+    host = libc.mach_host_self()
+    if libc.host_statistics64(host, HOST_VM_INFO64, ctypes.byref(stats), ctypes.byref(count)) != 0:
+        raise OSError("host_statistics64 failed")
+
+    free_pages = stats.free_count + stats.inactive_count + stats.speculative_count
+    free_bytes = free_pages * page_size
     used_gb = (total_bytes - free_bytes) / (1024 ** 3)
     return max(used_gb, 0.0), total_gb
 
 
+# Long-lived fd and reusable buffer for /proc/meminfo: the pseudofile
+# repopulates on every read from offset 0, so one open() at first use
+# replaces an open/close syscall pair per poll.
+_MEMINFO_FD: int | None = None
+_PROC_BUF = bytearray(8192)
+
+
 def _get_memory_linux() -> tuple[float, float]:
-    with open("/proc/meminfo") as f:
-        info = {}
-        for line in f:
-            parts = line.split()
-            if len(parts) >= 2:
-                key = parts[0].rstrip(":")
-                info[key] = int(parts[1])  # value in kB
-
-    total_kb = info.get("MemTotal", 0)
-    available_kb = info.get("MemAvailable", 0)
+    global _MEMINFO_FD
+    if _MEMINFO_FD is None:
+        _MEMINFO_FD = os.open("/proc/meminfo", os.O_RDONLY)
+    n = os.preadv(_MEMINFO_FD, (_PROC_BUF,), 0)
+
+    # Only two of ~50 meminfo fields matter; stop scanning once both are
+    # in hand instead of parsing the whole pseudofile into a dict.
+    total_kb = available_kb = 0
+    seen = 0
+    for line in _PROC_BUF[:n].split(b"\n"):
+        # Slice past the matched label so only the value token is split out.
+        if line.startswith(b"MemTotal:"):
+            total_kb = int(line[9:].split(maxsplit=1)[0])  # value in kB
+            seen += 1
+        elif line.startswith(b"MemAvailable:"):
+            available_kb = int(line[13:].split(maxsplit=1)[0])
+            seen += 1
+        if seen == 2:
+            break
+
     total_gb = total_kb / (1024 ** 2)
     used_gb = (total_kb - available_kb) / (1024 ** 2)
     return max(used_gb, 0.0), total_gb
 
 
-def _get_memory_windows() -> tuple[float, float]:
+if platform.system() == "Windows":
     import ctypes
     import ctypes.wintypes
 
-    class MEMORYSTATUSEX(ctypes.Structure):
+    # Creating a ctypes Structure type registers a new metaclass-built type
+    # each time; build it once at import instead of per poll.
+    class _MEMORYSTATUSEX(ctypes.Structure):
         _fields_ = [
             ("dwLength", ctypes.wintypes.DWORD),
             ("dwMemoryLoad", ctypes.wintypes.DWORD),
@@ -96,21 +151,47 @@ def _get_memory_windows() -> tuple[float, float]:
             ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
         ]
 
-    stat = MEMORYSTATUSEX()
-    stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
-    ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat))  # type: ignore[attr-defined]
+    _GlobalMemoryStatusEx = ctypes.windll.kernel32.GlobalMemoryStatusEx  # type: ignore[attr-defined]
+
+
+def _get_memory_windows() -> tuple[float, float]:
+    import ctypes
+
+    stat = _MEMORYSTATUSEX()
+    stat.dwLength = ctypes.sizeof(_MEMORYSTATUSEX)
+    _GlobalMemoryStatusEx(ctypes.byref(stat))
     total_gb = stat.ullTotalPhys / (1024 ** 3)
     used_gb = (stat.ullTotalPhys - stat.ullAvailPhys) / (1024 ** 3)
     return used_gb, total_gb
 
 
+# CPU count is fixed for the process; re-reading sysconf per poll is waste.
+_CPU_COUNT = os.cpu_count() or 1
+
+# Long-lived fd for /proc/loadavg, same pattern as _MEMINFO_FD above.
+# -1 means the pseudofile is unavailable (non-Linux) — fall back to
+# os.getloadavg, which opens a fresh fd internally.
+_LOADAVG_FD: int | None = None
+_LOADAVG_BUF = bytearray(128)
+
+
 def _get_cpu_load() -> float:
     """Return 1-minute load average normalized by CPU count, or 0.0 on Windows."""
+    global _LOADAVG_FD
+    if _LOADAVG_FD is None:
+        try:
+            _LOADAVG_FD = os.open("/proc/loadavg", os.O_RDONLY)
+        except OSError:
+            _LOADAVG_FD = -1
+    if _LOADAVG_FD >= 0:
+        try:
+            n = os.preadv(_LOADAVG_FD, (_LOADAVG_BUF,), 0)
+            load = float(_LOADAVG_BUF[:_LOADAVG_BUF.index(b" ", 0, n)])
+            return load / _CPU_COUNT
+        except (OSError, ValueError):
+            return 0.0
     try:
-        import os
-        load = os.getloadavg()[0]
-        cpus = os.cpu_count() or 1
-        return load / cpus
+        return os.getloadavg()[0] / _CPU_COUNT
     except (OSError, AttributeError):
         return 0.0
 
@@ -118,15 +199,22 @@ def _get_cpu_load() -> float:
 class SystemResourcesManager:
     def __init__(self, poll_interval: float = 30.0) -> None:
         self._poll_interval = poll_interval
-        self._lock = Lock()
         self._cached: ResourceSnapshot | None = None
         self._last_poll: float = 0.0
+        # (snapshot, lines, joined) — formatting is recomputed only when a
+        # new snapshot object is published, not on every render frame.
+        self._formatted: tuple[ResourceSnapshot, list[str], str] | None = None
 
     def snapshot(self) -> ResourceSnapshot | None:
+        # Lock-free: snapshots are immutable once built and attribute
+        # assignment is atomic under the GIL. A reader can still pair the
+        # old snapshot with the new timestamp and return the previous
+        # snapshot one extra time, or two threads can poll concurrently —
+        # both harmless at a 30s poll interval.
         now = time.monotonic()
-        with self._lock:
-            if self._cached is not None and (now - self._last_poll) < self._poll_interval:
-                return self._cached
+        cached = self._cached
+        if cached is not None and (now - self._last_poll) < self._poll_interval:
+            return cached
         try:
             disk_used, disk_total = _get_disk_usage()
         except Exception:
@@ -146,9 +234,8 @@ class SystemResourcesManager:
             mem_total_gb=mem_total,
             cpu_load=cpu_load,
         )
-        with self._lock:
-            self._cached = snap
-            self._last_poll = now
+        self._cached = snap
+        self._last_poll = now
         return snap
 
     def is_system_saturated(self, threshold: float = 0.8) -> bool:
@@ -163,11 +250,16 @@ class SystemResourcesManager:
         snap = self.snapshot()
         if snap is None:
             return []
-        return [
-            f"Disk: {snap.disk_used_gb:.1f}/{snap.disk_total_gb:.1f} GB",
-            f"RAM: {snap.mem_used_gb:.1f}/{snap.mem_total_gb:.1f} GB",
-        ]
+        formatted = self._formatted
+        if formatted is None or formatted[0] is not snap:
+            lines = [
+                f"Disk: {snap.disk_used_gb:.1f}/{snap.disk_total_gb:.1f} GB",
+                f"RAM: {snap.mem_used_gb:.1f}/{snap.mem_total_gb:.1f} GB",
+            ]
+            formatted = (snap, lines, "  |  ".join(lines))
+            self._formatted = formatted
+        return formatted[1]
 
     def format_line(self) -> str:
-        lines = self.format_lines()
-        return "  |  ".join(lines)
+        self.format_lines()
+        return self._formatted[2] if self._formatted is not None else ""
@@ -5,6 +5,9 @@ from datetime import datetime
 
 from asciipal.config import Config
 
+# Bound once: saves the module + attribute chase on every render frame.
+_now = datetime.now
+
 
 @dataclass(slots=True)
 class TimeOfDayEffect:
@@ -32,14 +35,31 @@ TIME_PERIODS: dict[str, TimeOfDayEffect] = {
 }
 
 
+# Frame-indexed (above, below) pairs per period, precomputed so the render
+# hot path does one dict lookup and one tuple index instead of attribute
+# chases into the dataclass lists.
+TIME_PERIODS_FLAT: dict[str, tuple[tuple[str, str], tuple[str, str]]] = {
+    period: (
+        (eff.above[0], eff.below[0]),
+        (eff.above[1], eff.below[1]),
+    )
+    for period, eff in TIME_PERIODS.items()
+}
+
+
+# Period per clock hour, precomputed so get_period is a single table load
+# instead of chained range comparisons.
+_PERIOD_BY_HOUR: tuple[str, ...] = tuple(
+    "morning" if 6 <= h < 12
+    else "afternoon" if 12 <= h < 17
+    else "evening" if 17 <= h < 21
+    else "night"
+    for h in range(24)
+)
+
+
 def get_period(hour: int) -> str:
-    if 6 <= hour < 12:
-        return "morning"
-    if 12 <= hour < 17:
-        return "afternoon"
-    if 17 <= hour < 21:
-        return "evening"
-    return "night"
+    return _PERIOD_BY_HOUR[hour]
 
 
 class TimeAwarenessManager:
@@ -49,8 +69,6 @@ class TimeAwarenessManager:
     def current_effect(self, frame: int, now: datetime | None = None) -> tuple[str, str] | None:
         if not self._config.time_awareness_enabled:
             return None
-        dt = now if now is not None else datetime.now()
+        dt = now if now is not None else _now()
         period = get_period(dt.hour)
-        effect = TIME_PERIODS[period]
-        idx = frame % 2
-        return (effect.above[idx], effect.below[idx])
+        return TIME_PERIODS_FLAT[period][frame & 1]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
-import urllib.request
 from dataclasses import dataclass
-from threading import Event, Lock, Thread
+from threading import Lock, Thread
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import http.client
 
 from asciipal.config import Config
+from asciipal.polling import POLL_WORKER
 
 
 @dataclass(slots=True)
@@ -157,67 +160,124 @@ WWO_CODE_MAP: dict[int, str] = {
 }
 
 
+# Frame-indexed (above, below) pairs per effect, precomputed so the render
+# hot path is one tuple index instead of dict + attribute + list lookups.
+EFFECTS_FLAT: dict[str, tuple[tuple[str, str], tuple[str, str]]] = {
+    name: (
+        (eff.above[0], eff.below[0]),
+        (eff.above[1], eff.below[1]),
+    )
+    for name, eff in EFFECTS.items()
+}
+
+
+# Dense lookup table for the small-int WWO codes: one bounds check and an
+# array load per refresh instead of dict hashing. The dict above stays as
+# the readable source of truth.
+_WWO_TABLE: tuple[str | None, ...] = tuple(WWO_CODE_MAP.get(i) for i in range(400))
+
+
 def code_to_effect(code: int) -> str | None:
-    return WWO_CODE_MAP.get(code)
+    return _WWO_TABLE[code] if 0 <= code < 400 else None
 
 
 class WeatherManager:
     def __init__(self, config: Config) -> None:
         self._config = config
         self._current_effect: str | None = None
+        self._current_effect_flat: tuple[tuple[str, str], tuple[str, str]] | None = None
         self._lock = Lock()
-        self._stop = Event()
+        self._job_id: int | None = None
         self._thread: Thread | None = None
+        self._conn: http.client.HTTPSConnection | None = None
 
     def start(self) -> None:
-        if not self._config.weather_enabled:
+        if not self._config.weather_enabled or self._job_id is not None:
             return
-        self._stop.clear()
-        self._thread = Thread(target=self._poll_loop, daemon=True)
-        self._thread.start()
+        interval = max(self._config.weather_poll_minutes, 5) * 60
+        self._job_id = POLL_WORKER.register(self._poll_once, interval)
+        self._thread = POLL_WORKER.thread
 
     def stop(self) -> None:
-        self._stop.set()
-        if self._thread is not None:
-            self._thread.join(timeout=5)
-            self._thread = None
+        if self._job_id is not None:
+            POLL_WORKER.unregister(self._job_id)
+            self._job_id = None
+        self._thread = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
-    def _poll_loop(self) -> None:
-        interval = max(self._config.weather_poll_minutes, 5) * 60
-        while not self._stop.is_set():
+    def _http_get(self, path: str) -> bytes:
+        """GET ``path`` from wttr.in, reusing a kept-alive TLS connection.
+
+        Keeping the connection between polls skips the TCP + TLS handshake
+        each fetch; a socket the server has since closed is dropped and the
+        request retried once on a fresh connection.
+        """
+        # Deferred imports: weather is disabled by default, and http.client
+        # drags in a sizable import graph most startups never need.
+        import gzip
+        import http.client
+
+        headers = {"User-Agent": "asciipal", "Accept-Encoding": "gzip"}
+        last_err: Exception | None = None
+        for _attempt in range(2):
+            if self._conn is None:
+                self._conn = http.client.HTTPSConnection("wttr.in", timeout=10)
             try:
-                self._fetch_weather()
-            except Exception:
-                pass
-            self._stop.wait(timeout=interval)
+                self._conn.request("GET", path, headers=headers)
+                resp = self._conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, OSError) as err:
+                self._conn.close()
+                self._conn = None
+                last_err = err
+                continue
+            if resp.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return body
+        raise last_err if last_err is not None else OSError("weather fetch failed")
+
+    def _poll_once(self) -> None:
+        try:
+            self._fetch_weather()
+        except Exception:
+            pass
 
     def _fetch_weather(self) -> None:
+        # format=%x returns just the condition code — a few bytes instead of
+        # the ~5 KB j1 JSON document we previously parsed for one field.
         location = self._config.weather_location or ""
-        url = f"https://wttr.in/{location}?format=j1"
-        req = urllib.request.Request(url, headers={"User-Agent": "asciipal"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
-        code = int(data["current_condition"][0]["weatherCode"])
+        body = self._http_get(f"/{location}?format=%x")
+        self._apply_condition_code(int(body.strip()))
+
+    def _apply_condition_code(self, code: int) -> None:
+        """Map a WWO condition code to an effect and publish it."""
         effect = code_to_effect(code)
         with self._lock:
             self._current_effect = effect
+            self._current_effect_flat = EFFECTS_FLAT.get(effect) if effect else None
 
     def clear_effect(self) -> None:
         with self._lock:
             self._current_effect = None
+            self._current_effect_flat = None
 
     def current_effect(self, frame: int) -> tuple[str, str] | None:
         if not self._config.weather_enabled:
             return None
-        with self._lock:
+        flat = self._current_effect_flat
+        if flat is None:
+            # The effect name is the source of truth; resolve and memoize
+            # the flat pair if it was set without going through a fetch.
             effect_name = self._current_effect
-        if effect_name is None:
-            return None
-        effect = EFFECTS.get(effect_name)
-        if effect is None:
-            return None
-        idx = frame % 2
-        return (effect.above[idx], effect.below[idx])
+            if effect_name is None:
+                return None
+            flat = EFFECTS_FLAT.get(effect_name)
+            if flat is None:
+                return None
+            self._current_effect_flat = flat
+        return flat[frame & 1]
 
     def current_condition_name(self) -> str | None:
         """Return the title-cased name of the current weather condition.
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import copy
+import random
+
+import pytest
+
+from asciipal.app import _compose_display
+from asciipal.config import Config
+from asciipal.time_awareness import TIME_PERIODS
+from asciipal.weather import EFFECTS
+
+
+@pytest.fixture(scope="session")
+def empty_scene_30():
+    """One shared empty 30-wide display for invariant checks.
+
+    ``ColoredDisplay`` is frozen, so the session-scoped instance is safe
+    to share across tests.
+    """
+    return _compose_display(
+        char_art="X",
+        above_lines=[],
+        plant_lines=[],
+        progress_line="",
+        status_line="",
+        achievement_line="",
+        inner_w=30,
+    )
+
+
+@pytest.fixture(scope="session")
+def default_config() -> Config:
+    """One default Config for tests that never mutate it."""
+    return Config.replace()
+
+
+_RNG_TEMPLATE = random.Random(42)
+
+
+@pytest.fixture
+def rng_factory():
+    """Return a factory for fresh seed-42 RNGs.
+
+    Copying the template clones the generator state directly, skipping the
+    Mersenne-Twister re-seeding each ``random.Random(42)`` would pay.
+    """
+    return lambda: copy.copy(_RNG_TEMPLATE)
+
+
+@pytest.fixture(
+    params=[("time", key, effect) for key, effect in TIME_PERIODS.items()]
+    + [("weather", key, effect) for key, effect in EFFECTS.items()],
+    ids=lambda p: f"{p[0]}:{p[1]}",
+)
+def any_effect(request):
+    """Every time-of-day and weather effect; both share the same frame shape."""
+    return request.param[2]
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from asciipal.activity_tracker import ActivitySnapshot
 from asciipal.break_manager import BreakManager
-from asciipal.config import Config, DEFAULT_CONFIG
+from asciipal.config import Config
 
 
 def _config() -> Config:
-    return Config.from_dict(dict(DEFAULT_CONFIG))
+    return Config.replace()
 
 
 def _active_snapshot() -> ActivitySnapshot:
@@ -57,11 +57,9 @@ def test_break_starts_when_overdue_and_user_idle() -> None:
 
 
 def test_pomodoro_uses_pomodoro_timers() -> None:
-    cfg_data = dict(DEFAULT_CONFIG)
-    cfg_data["pomodoro_mode"] = True
-    cfg_data["pomodoro_work_minutes"] = 1
-    cfg_data["pomodoro_break_minutes"] = 2
-    cfg = Config.from_dict(cfg_data)
+    cfg = Config.replace(
+        pomodoro_mode=True, pomodoro_work_minutes=1, pomodoro_break_minutes=2,
+    )
     manager = BreakManager(cfg)
     manager._active_start = 0
     idle_snap = ActivitySnapshot(
@@ -7,7 +7,7 @@ from asciipal.config import Config, DEFAULT_CONFIG
 
 
 def _config() -> Config:
-    return Config.from_dict(dict(DEFAULT_CONFIG))
+    return Config.replace()
 
 
 def test_renderer_loads_bundled_art() -> None:
@@ -69,8 +69,7 @@ def test_renderer_eating_art_has_two_frames() -> None:
 def test_renderer_custom_art_override(tmp_path: Path) -> None:
     custom = tmp_path / "idle.txt"
     custom.write_text("(custom idle)", encoding="utf-8")
-    cfg = dict(DEFAULT_CONFIG)
-    cfg["custom_art"] = dict(DEFAULT_CONFIG["custom_art"])
-    cfg["custom_art"]["idle"] = str(custom)
-    renderer = CharacterRenderer(Config.from_dict(cfg))
+    custom_art = dict(DEFAULT_CONFIG["custom_art"])
+    custom_art["idle"] = str(custom)
+    renderer = CharacterRenderer(Config.replace(custom_art=custom_art))
     assert renderer.art_for("idle") == "(custom idle)"
@@ -4,14 +4,13 @@ from time import monotonic
 from unittest.mock import MagicMock
 
 from asciipal.break_manager import BreakManager
-from asciipal.config import Config, DEFAULT_CONFIG, _deep_merge
+from asciipal.config import Config
 from asciipal.overlay import MenuCallbacks
 from asciipal.weather import WeatherManager
 
 
 def _make_config(**overrides) -> Config:
-    data = _deep_merge(DEFAULT_CONFIG, overrides)
-    return Config.from_dict(data)
+    return Config.replace(**overrides)
 
 
 class TestForceBreak:
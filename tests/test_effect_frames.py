@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+
+class TestEffectFrameStructure:
+    """Shared frame-shape invariants for time-of-day and weather effects."""
+
+    def test_two_frames_each(self, any_effect) -> None:
+        assert len(any_effect.above) == 2
+        assert len(any_effect.below) == 2
+
+    def test_above_frames_same_width(self, any_effect) -> None:
+        widths = [len(f) for f in any_effect.above]
+        assert len(set(widths)) == 1, f"above frames have inconsistent widths: {widths}"
+
+    def test_below_frames_same_width(self, any_effect) -> None:
+        widths = [len(f) for f in any_effect.below]
+        assert len(set(widths)) == 1, f"below frames have inconsistent widths: {widths}"
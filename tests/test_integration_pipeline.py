@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from asciipal.activity_tracker import ActivityTracker
-from asciipal.config import Config, DEFAULT_CONFIG
+from asciipal.config import Config
 from asciipal.state_machine import StateMachine
 
 
-def test_pipeline_transitions_from_excited_to_sleeping() -> None:
-    cfg = Config.from_dict(dict(DEFAULT_CONFIG))
+def test_pipeline_transitions_from_excited_to_sleeping(default_config: Config) -> None:
+    cfg = default_config
     tracker = ActivityTracker(window_seconds=10)
     tracker.session_start_time = 0
     tracker.last_input_time = 0
@@ -5,12 +5,8 @@ from asciipal.config import Config, DEFAULT_CONFIG
 from asciipal.state_machine import StateMachine
 
 
-def _config() -> Config:
-    return Config.from_dict(dict(DEFAULT_CONFIG))
-
-
-def test_sleeping_beats_other_states() -> None:
-    machine = StateMachine(_config(), cooldown_seconds=0)
+def test_sleeping_beats_other_states(default_config: Config) -> None:
+    machine = StateMachine(default_config, cooldown_seconds=0)
     snap = ActivitySnapshot(
         typing_wpm=200,
         click_rate=20,
@@ -22,8 +18,8 @@ def test_sleeping_beats_other_states() -> None:
     assert result.state == "sleeping"
 
 
-def test_excited_when_fast_typing() -> None:
-    machine = StateMachine(_config(), cooldown_seconds=0)
+def test_excited_when_fast_typing(default_config: Config) -> None:
+    machine = StateMachine(default_config, cooldown_seconds=0)
     snap = ActivitySnapshot(
         typing_wpm=120,
         click_rate=0,
@@ -36,9 +32,7 @@ def test_excited_when_fast_typing() -> None:
 
 
 def test_dizzy_threshold_comes_from_config() -> None:
-    cfg_data = dict(DEFAULT_CONFIG)
-    cfg_data["dizzy_mouse_speed"] = 50
-    machine = StateMachine(Config.from_dict(cfg_data), cooldown_seconds=0)
+    machine = StateMachine(Config.replace(dizzy_mouse_speed=50), cooldown_seconds=0)
     snap = ActivitySnapshot(
         typing_wpm=0,
         click_rate=0,
@@ -50,8 +44,8 @@ def test_dizzy_threshold_comes_from_config() -> None:
     assert result.state == "dizzy"
 
 
-def test_sweating_when_system_saturated() -> None:
-    machine = StateMachine(_config(), cooldown_seconds=0)
+def test_sweating_when_system_saturated(default_config: Config) -> None:
+    machine = StateMachine(default_config, cooldown_seconds=0)
     machine.set_sweating(True)
     snap = ActivitySnapshot(
         typing_wpm=0,
@@ -64,8 +58,8 @@ def test_sweating_when_system_saturated() -> None:
     assert result.state == "sweating"
 
 
-def test_sweating_off_does_not_trigger() -> None:
-    machine = StateMachine(_config(), cooldown_seconds=0)
+def test_sweating_off_does_not_trigger(default_config: Config) -> None:
+    machine = StateMachine(default_config, cooldown_seconds=0)
     machine.set_sweating(False)
     snap = ActivitySnapshot(
         typing_wpm=0,
@@ -79,9 +73,7 @@ def test_sweating_off_does_not_trigger() -> None:
 
 
 def test_default_cooldown_from_config_is_applied() -> None:
-    cfg_data = dict(DEFAULT_CONFIG)
-    cfg_data["state_cooldown_seconds"] = 5.0
-    machine = StateMachine(Config.from_dict(cfg_data))
+    machine = StateMachine(Config.replace(state_cooldown_seconds=5.0))
 
     snap1 = ActivitySnapshot(
         typing_wpm=100,
@@ -94,7 +86,7 @@ def test_default_cooldown_from_config_is_applied() -> None:
         typing_wpm=0,
         click_rate=0,
         mouse_speed=0,
-        seconds_since_input=cfg_data["idle_timeout_seconds"] + 1,
+        seconds_since_input=DEFAULT_CONFIG["idle_timeout_seconds"] + 1,
         total_active_seconds=10,
     )
     first = machine.update(snap1, now=10)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+
 from asciipal.system_resources import (
     ResourceSnapshot,
     SystemResourcesManager,
@@ -10,31 +12,45 @@ from asciipal.system_resources import (
 )
 
 
+@pytest.fixture(scope="session")
+def disk_usage() -> tuple[float, float]:
+    """One real statvfs call shared across the property checks."""
+    return _get_disk_usage()
+
+
+@pytest.fixture(scope="session")
+def memory_usage() -> tuple[float, float]:
+    """One real memory probe shared across the property checks."""
+    return _get_memory_usage()
+
+
 class TestGetDiskUsage:
-    def test_returns_floats(self) -> None:
-        used, total = _get_disk_usage()
+    def test_returns_floats(self, disk_usage: tuple[float, float]) -> None:
+        used, total = disk_usage
         assert isinstance(used, float)
         assert isinstance(total, float)
 
-    def test_total_positive(self) -> None:
-        _used, total = _get_disk_usage()
+    def test_total_positive(self, disk_usage: tuple[float, float]) -> None:
+        _used, total = disk_usage
         assert total > 0
 
-    def test_used_lte_total(self) -> None:
-        used, total = _get_disk_usage()
+    def test_used_lte_total(self, disk_usage: tuple[float, float]) -> None:
+        used, total = disk_usage
         assert used <= total
 
 
 class TestGetMemoryUsage:
-    def test_returns_floats(self) -> None:
-        used, total = _get_memory_usage()
+    def test_returns_floats(self, memory_usage: tuple[float, float]) -> None:
+        used, total = memory_usage
         assert isinstance(used, float)
         assert isinstance(total, float)
 
-    def test_total_positive_on_supported_platform(self) -> None:
+    def test_total_positive_on_supported_platform(
+        self, memory_usage: tuple[float, float]
+    ) -> None:
         import platform
         if platform.system() in ("Darwin", "Linux", "Windows"):
-            _used, total = _get_memory_usage()
+            _used, total = memory_usage
             assert total > 0
 
 
@@ -4,7 +4,7 @@ from datetime import datetime
 
 import pytest
 
-from asciipal.config import Config, DEFAULT_CONFIG, _deep_merge
+from asciipal.config import Config
 from asciipal.time_awareness import (
     TIME_PERIODS,
     TimeAwarenessManager,
@@ -13,8 +13,7 @@ from asciipal.time_awareness import (
 
 
 def _make_config(**overrides) -> Config:
-    data = _deep_merge(DEFAULT_CONFIG, overrides)
-    return Config.from_dict(data)
+    return Config.replace(**overrides)
 
 
 class TestGetPeriod:
@@ -36,28 +35,6 @@ class TestGetPeriod:
         assert get_period(hour) == expected
 
 
-class TestEffectFrames:
-    @pytest.mark.parametrize("period", list(TIME_PERIODS.keys()))
-    def test_two_frames_each(self, period: str) -> None:
-        effect = TIME_PERIODS[period]
-        assert len(effect.above) == 2
-        assert len(effect.below) == 2
-
-
-class TestWidthConsistency:
-    @pytest.mark.parametrize("period", list(TIME_PERIODS.keys()))
-    def test_above_frames_same_width(self, period: str) -> None:
-        effect = TIME_PERIODS[period]
-        widths = [len(f) for f in effect.above]
-        assert len(set(widths)) == 1, f"{period} above frames have inconsistent widths: {widths}"
-
-    @pytest.mark.parametrize("period", list(TIME_PERIODS.keys()))
-    def test_below_frames_same_width(self, period: str) -> None:
-        effect = TIME_PERIODS[period]
-        widths = [len(f) for f in effect.below]
-        assert len(set(widths)) == 1, f"{period} below frames have inconsistent widths: {widths}"
-
-
 class TestSkyCharacters:
     def test_morning_has_sun_chars(self) -> None:
         effect = TIME_PERIODS["morning"]